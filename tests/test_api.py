@@ -11,6 +11,10 @@ import requests
 from ultralog.local import UltraLog
 from ultralog.server import args
 
+# Shared keep-alive session so the remote tests reuse pooled connections
+# instead of opening a new TCP connection per request.
+_SESSION = requests.Session()
+
 class TestLocalAPI(unittest.TestCase):
     def setUp(self):
         self.test_dir = tempfile.mkdtemp(prefix="ultralog_test_")
@@ -94,13 +98,13 @@ class TestRemoteAPI(unittest.TestCase):
 
     def test_health_check(self):
         """Test health check endpoint"""
-        response = requests.get("http://127.0.0.1:9999/health")
+        response = _SESSION.get("http://127.0.0.1:9999/health")
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), {"status": "healthy"})
 
     def test_log_without_auth(self):
         """Test without authentication"""
-        response = requests.post(
+        response = _SESSION.post(
             "http://127.0.0.1:9999/log",
             json={"message": "test", "level": "info"}
         )
@@ -108,7 +112,7 @@ class TestRemoteAPI(unittest.TestCase):
 
     def test_log_with_auth(self):
         """Test with authentication"""
-        response = requests.post(
+        response = _SESSION.post(
             "http://127.0.0.1:9999/log",
             json={"message": "test message", "level": "info"},
             headers={"Authorization": f"Bearer {args.auth_token}"}
@@ -118,16 +122,38 @@ class TestRemoteAPI(unittest.TestCase):
 
     def test_log_invalid_level(self):
         """Test invalid log level"""
-        response = requests.post(
+        response = _SESSION.post(
             "http://127.0.0.1:9999/log",
             json={"message": "test", "level": "invalid"},
             headers={"Authorization": f"Bearer {args.auth_token}"}
         )
         self.assertEqual(response.status_code, 200)
 
+    def test_log_batch(self):
+        """Test batched log submission"""
+        batch = [
+            {"message": f"batch message {i}", "level": "info"}
+            for i in range(10)
+        ]
+        response = _SESSION.post(
+            "http://127.0.0.1:9999/log_batch",
+            json={"batch": batch},
+            headers={"Authorization": f"Bearer {args.auth_token}"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"status": "success", "count": 10})
+
+    def test_log_batch_without_auth(self):
+        """Test batched submission without authentication"""
+        response = _SESSION.post(
+            "http://127.0.0.1:9999/log_batch",
+            json={"batch": [{"message": "test", "level": "info"}]}
+        )
+        self.assertEqual(response.status_code, 403)
+
     def test_log_missing_message(self):
         """Test missing message"""
-        response = requests.post(
+        response = _SESSION.post(
             "http://127.0.0.1:9999/log",
             json={"level": "info"},
             headers={"Authorization": f"Bearer {args.auth_token}"}
@@ -189,7 +215,7 @@ class TestConcurrentLogging(unittest.TestCase):
 
         def worker(thread_id):
             for i in range(messages_per_thread):
-                response = requests.post(
+                response = _SESSION.post(
                     "http://127.0.0.1:9999/log",
                     json={"message": f"Thread {thread_id} message {i}", "level": "info"},
                     headers={"Authorization": f"Bearer {auth_token}"}
@@ -16,6 +16,25 @@ class ConcurrencyTest:
         
     def cleanup(self):
         shutil.rmtree(self.test_dir)
+
+    def count_log_lines(self):
+        """Total lines across the log file and any rotated backups.
+
+        High-volume runs cross the default rotation threshold, so messages
+        may be split between concurrency.log and concurrency.log.N.
+        """
+        total = 0
+        for name in os.listdir(self.test_dir):
+            if name.startswith("concurrency.log"):
+                with open(os.path.join(self.test_dir, name)) as f:
+                    total += sum(1 for _ in f)
+        return total
+
+    def clear_log_files(self):
+        """Remove the log file and rotated backups left by a previous test"""
+        for name in os.listdir(self.test_dir):
+            if name.startswith("concurrency.log"):
+                os.remove(os.path.join(self.test_dir, name))
         
     def test_config_race_condition(self):
         """Test concurrent configuration modification"""
@@ -47,6 +66,7 @@ class ConcurrencyTest:
             
     def test_message_race_condition(self):
         """Test race conditions in multi-thread log writing"""
+        self.clear_log_files()
         ulog = UltraLog(fp=self.log_file, truncate_file=True, console_output=False)
         threads = []
         expected_count = self.num_threads * self.num_messages_per_thread
@@ -64,13 +84,41 @@ class ConcurrencyTest:
             t.join()
             
         ulog.close()
-        
+
         # Verify log integrity
-        with open(self.log_file) as f:
-            lines = f.readlines()
-            print(f"Multi-thread write test: Expected {expected_count}, Actual {len(lines)}")
-            assert len(lines) == expected_count, "Log count mismatch, possible race condition"
+        actual_count = self.count_log_lines()
+        print(f"Multi-thread write test: Expected {expected_count}, Actual {actual_count}")
+        assert actual_count == expected_count, "Log count mismatch, possible race condition"
             
+    def test_bulk_log_many(self):
+        """Test multi-thread bulk logging via log_many"""
+        self.clear_log_files()
+        ulog = UltraLog(fp=self.log_file, truncate_file=True, console_output=False)
+        threads = []
+        expected_count = self.num_threads * self.num_messages_per_thread
+
+        def bulk_worker(thread_id):
+            # Hand the whole per-thread batch over in one call
+            ulog.log_many([
+                (f"Thread {thread_id} bulk message {i}", 'INFO')
+                for i in range(self.num_messages_per_thread)
+            ])
+
+        for i in range(self.num_threads):
+            t = threading.Thread(target=bulk_worker, args=(i,))
+            threads.append(t)
+            t.start()
+
+        for t in threads:
+            t.join()
+
+        ulog.close()
+
+        # Verify log integrity
+        actual_count = self.count_log_lines()
+        print(f"Bulk write test: Expected {expected_count}, Actual {actual_count}")
+        assert actual_count == expected_count, "Log count mismatch in bulk logging"
+
     @staticmethod
     def process_worker(process_id, num_messages, log_file):
         """Worker function for multi-process log writing"""
@@ -110,6 +158,7 @@ class ConcurrencyTest:
         
         self.test_config_race_condition()
         self.test_message_race_condition()
+        self.test_bulk_log_many()
         self.test_multiprocess_logging()
         
         self.cleanup()
@@ -7,6 +7,8 @@ provides a thin Python wrapper for convenience.
 """
 
 import sys
+import threading
+from collections import deque
 from typing import Optional
 
 from ultralog._ultralog import UltraLog as _RustLog  # type: ignore[import]
@@ -14,23 +16,6 @@ from ultralog._ultralog import UltraLog as _RustLog  # type: ignore[import]
 __version__ = "0.5.0"
 
 
-# ── Remote helper ─────────────────────────────────────────────────────────────
-def _remote_post(server_url: str, auth_token: str, level: str, msg: str,
-                 console_output: bool) -> None:
-    try:
-        import requests
-        response = requests.post(
-            f"{server_url}/log",
-            json={"level": level, "message": msg},
-            headers={"Authorization": f"Bearer {auth_token}"},
-            timeout=5,
-        )
-        response.raise_for_status()
-    except Exception as exc:
-        if console_output:
-            print(f"Remote logging failed: {exc}", file=sys.stderr)
-
-
 # ── Public UltraLog ───────────────────────────────────────────────────────────
 
 class UltraLog:
@@ -75,6 +60,11 @@ class UltraLog:
         Bearer token for the remote server.
     """
 
+    # Remote batching: how many records go into one POST, and how long the
+    # sender waits for more before shipping a partial batch.
+    _REMOTE_BATCH_SIZE = 64
+    _REMOTE_FLUSH_INTERVAL = 0.1
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -100,6 +90,34 @@ class UltraLog:
         self.console_output = console_output
         self._level = level
         self._logger = None
+        self._session = None
+
+        if self._mode == "remote":
+            # One keep-alive session for the lifetime of the logger: every
+            # log call reuses a pooled connection instead of paying a fresh
+            # TCP (and possibly TLS) handshake. The pool is sized for
+            # multi-threaded callers so they don't serialize on one socket.
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            self._session = requests.Session()
+            self._session.headers.update({"Authorization": f"Bearer {auth_token}"})
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+
+            # Records are queued here and shipped in bundles by a background
+            # sender, so N log calls cost ~N/_REMOTE_BATCH_SIZE round-trips
+            # instead of N. Falls back to per-record /log posts if the
+            # server does not expose /log_batch.
+            self._remote_queue = deque()
+            self._remote_wake = threading.Event()
+            self._remote_closed = False
+            self._batch_unsupported = False
+            self._remote_thread = threading.Thread(
+                target=self._remote_batch_sender, daemon=True
+            )
+            self._remote_thread.start()
 
         if self._mode == "local":
             buf   = file_buffer_size or 1024 * 1024
@@ -142,9 +160,53 @@ class UltraLog:
         if self._logger is not None:
             self._logger.log(msg, level)
         elif self._mode == "remote":
-            _remote_post(
-                self._server_url, self._auth_token, level, msg, self.console_output
-            )
+            self._remote_log(level, msg)
+
+    def _remote_log(self, level: str, msg: str) -> None:
+        self._remote_queue.append({"level": level, "message": msg})
+        if len(self._remote_queue) >= self._REMOTE_BATCH_SIZE:
+            self._remote_wake.set()
+
+    def _remote_batch_sender(self) -> None:
+        while not self._remote_closed:
+            self._remote_wake.wait(timeout=self._REMOTE_FLUSH_INTERVAL)
+            self._remote_wake.clear()
+            self._send_pending()
+        self._send_pending()
+
+    def _send_pending(self) -> None:
+        queue = self._remote_queue
+        while queue:
+            batch = []
+            try:
+                while len(batch) < self._REMOTE_BATCH_SIZE:
+                    batch.append(queue.popleft())
+            except IndexError:
+                pass
+            if batch:
+                self._post_batch(batch)
+
+    def _post_batch(self, batch: list) -> None:
+        try:
+            if not self._batch_unsupported:
+                response = self._session.post(
+                    f"{self._server_url}/log_batch",
+                    json={"batch": batch},
+                    timeout=5,
+                )
+                if response.status_code != 404:
+                    response.raise_for_status()
+                    return
+                # Older servers: remember and replay per record below
+                self._batch_unsupported = True
+            for entry in batch:
+                response = self._session.post(
+                    f"{self._server_url}/log", json=entry, timeout=5
+                )
+                response.raise_for_status()
+        except Exception as exc:
+            if self.console_output:
+                print(f"Remote logging failed: {exc}", file=sys.stderr)
 
     def debug(self, msg: str) -> None:
         if self._logger is not None:
@@ -185,6 +247,11 @@ class UltraLog:
     def close(self) -> None:
         if self._logger is not None:
             self._logger.close()
+        if self._session is not None:
+            self._remote_closed = True
+            self._remote_wake.set()
+            self._remote_thread.join(timeout=10.0)
+            self._session.close()
 
     # ── Backend info ──────────────────────────────────────────────────────────
 
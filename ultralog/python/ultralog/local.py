@@ -2,37 +2,16 @@ import os
 import sys
 import threading
 import time
-import queue
-import functools
-import psutil
-from typing import Optional, Callable, Any
+from collections import deque
+from typing import Optional
 
 from .utils import get_env_variable, LogFormatter
 
-def monitor_memory(func: Callable) -> Callable:
-    """Decorator to monitor memory usage of critical functions"""
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs) -> Any:
-        process = psutil.Process(os.getpid())
-        mem_before = process.memory_info().rss / (1024 * 1024)  # MB
-        
-        result = func(*args, **kwargs)
-        
-        mem_after = process.memory_info().rss / (1024 * 1024)
-        mem_diff = mem_after - mem_before
-        
-        # Only log if memory change is significant (>1MB)
-        if abs(mem_diff) > 1:
-            instance = args[0] if args else None
-            if hasattr(instance, '_safe_console_output'):
-                instance._safe_console_output(
-                    f"Memory usage by {func.__name__}: {mem_diff:.2f}MB "
-                    f"(before: {mem_before:.2f}MB, after: {mem_after:.2f}MB)"
-                )
-        
-        return result
-    return wrapper
-
+# os.writev is POSIX-only (absent on Windows)
+_HAS_WRITEV = hasattr(os, 'writev')
+# fdatasync skips the metadata flush (mtime and friends) that fsync pays;
+# fall back to fsync where it does not exist (macOS, Windows).
+_fdatasync = getattr(os, 'fdatasync', os.fsync)
 
 class UltraLog:
     """
@@ -40,16 +19,26 @@ class UltraLog:
     """
 
     _LOG_LEVELS = {'DEBUG': 10, 'INFO': 20, 'WARNING': 30, 'ERROR': 40, 'CRITICAL': 50}
-    _TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
-    _TIMESTAMP_CACHE_TIME = 2.0  # Increased from 0.5s to 2s
     _DEFAULT_FILE_BUFFER_SIZE = 512 * 1024  # 512KB (restored buffer optimization)
-    _SEGMENTED_LOCK_COUNT = 4  # Reduced from 8 to simplify lock granularity
     _BATCH_SIZE = 100  # Increased batch size (restored optimization)
     _FLUSH_INTERVAL = 0.1  # Adjusted flush interval (restored optimization)
-    _MAX_MEMORY_USAGE = 100  # MB - soft memory limit
-    _CRITICAL_MEMORY_USAGE = 150  # MB - hard memory limit
-    _LARGE_MESSAGE_THRESHOLD = 8 * 1024  # 8KB - consider message large if bigger
+    _LOCAL_BATCH_SIZE = 32  # Messages collected per thread before queue handoff
+    # Byte trigger for the same handoff: a few large messages should not sit
+    # in a staging buffer waiting for 32 siblings, and a byte-triggered
+    # handoff wakes the writer immediately since a write is already justified.
+    _LOCAL_BATCH_MAX_BYTES = 64 * 1024
     _MAX_MESSAGE_SIZE = 10 * 1024  # 10KB - maximum allowed message size
+    # Group commit for force_sync: instead of a durable sync per written
+    # part, sync once every N parts or every T ns, whichever comes first.
+    # Rotation, sync_now() and close() remain hard barriers.
+    _SYNC_BATCH_LIMIT = 10
+    _SYNC_INTERVAL_NS = 100_000_000  # 100ms
+    # Backpressure cap on the shared queue: producers park briefly instead of
+    # handing off once this many messages are pending, so a burst that
+    # outruns the writer cannot grow memory without bound. At the 10KB
+    # message cap this bounds queued payload to ~640MB worst case, far less
+    # for typical messages. Messages are never dropped.
+    _MAX_PENDING_MESSAGES = 65536
 
     def __init__(
         self,
@@ -98,6 +87,9 @@ class UltraLog:
         self.max_file_size = max_file_size
         self.backup_count = backup_count
         self.console_output = console_output
+        # Logs-about-logging: per-message/per-batch diagnostics are only
+        # formatted and printed when tracing is switched on explicitly.
+        self._trace = False
         self.force_sync = force_sync
         self.enable_rotation = enable_rotation
         self._FILE_BUFFER_SIZE = file_buffer_size or self._DEFAULT_FILE_BUFFER_SIZE
@@ -105,26 +97,49 @@ class UltraLog:
         self._FLUSH_INTERVAL = flush_interval or self._FLUSH_INTERVAL
 
         # File handling
-        self._file = None
-        self._file_handle = None
+        self._fd = None
         self._current_size = 0
+        # Writer-owned fuse buffer for platforms without os.writev: batches
+        # are copied into it before the single os.write, and its backing
+        # allocation is reused across flushes instead of a fresh b"".join
+        # bytes object per batch.
+        self._join_buf = bytearray()
+        # Group-commit bookkeeping for force_sync (see _write_part)
+        self._unsynced_parts = 0
+        self._last_sync_ns = time.monotonic_ns()
         self._closed = False
-        self._write_queue = queue.Queue()
-        # Batch buffer for message collection
-        self._batch_buffer = []
-        self._batch_lock = threading.Lock()
-        self._last_flush_time = time.time()
-
-        # Timestamp caching
-        self._last_timestamp = ""
-        self._last_timestamp_time = 0
-        self._timestamp_lock = threading.Lock()
-
-        # File lock for state protection
+        # deque.append/popleft are atomic under the GIL, so producers and the
+        # writer thread never take an explicit lock per message (unlike
+        # queue.Queue, which locks on every put/get).
+        self._write_queue = deque()
+        # Wakes the writer thread early when enough messages have queued up,
+        # instead of always waiting out the full flush interval.
+        self._wake = threading.Event()
+        # Per-thread staging buffers: each producer collects messages in its
+        # own list and hands the whole list to the shared queue once it holds
+        # _LOCAL_BATCH_SIZE entries, so queue contention is paid once per
+        # local batch instead of once per message. The registry lets the
+        # writer thread collect buffers of exited threads and lets close()
+        # drain stragglers.
+        self._tls = threading.local()
+        self._local_batches = {}
+        self._local_batches_lock = threading.Lock()
+        # Single lock serializing file writes, rotation and handle swaps
         self._file_lock = threading.Lock()
-        
-        # Segmented file locks for better concurrency
-        self._file_locks = [threading.Lock() for _ in range(self._SEGMENTED_LOCK_COUNT)]
+
+        # Rotation staging: the writer only renames the full file to a
+        # sequence-numbered staging name and reopens; the worker thread does
+        # the O(backup_count) rename chain outside the file lock.
+        self._rotation_seq = 0
+        self._rotation_queue = deque()
+        self._rotation_wake = threading.Event()
+        self._rotation_thread = None
+        if fp and enable_rotation:
+            self._rotation_thread = threading.Thread(
+                target=self._rotation_worker,
+                daemon=True
+            )
+            self._rotation_thread.start()
 
         # Initialize file handling
         if fp:
@@ -171,13 +186,21 @@ class UltraLog:
             return
 
         try:
-            self._file_handle = open(self.fp, 'ab', buffering=self._FILE_BUFFER_SIZE)
-            self._file = self._file_handle
-            self._current_size = os.path.getsize(self.fp) if os.path.exists(self.fp) else 0
+            # A raw fd instead of a Python file object: batches are already
+            # coalesced in user space (the per-thread staging buffers and
+            # the writer's batch list) and every write goes through
+            # os.write/os.writev, so even the thin io.FileIO wrapper was a
+            # layer with nothing to do. O_APPEND makes every write land at
+            # the end regardless of who else has the file open.
+            self._fd = os.open(
+                self.fp, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+            )
+            # One fstat on the fd we already hold instead of an
+            # exists/getsize pair on the path.
+            self._current_size = os.fstat(self._fd).st_size
         except Exception as e:
             self._safe_console_output(f"Error opening log file: {e}")
-            self._file = None
-            self._file_handle = None
+            self._fd = None
 
     def _safe_console_output(self, message: str):
         """Thread-safe console output"""
@@ -191,158 +214,203 @@ class UltraLog:
         """Ensure proper cleanup when logger is garbage collected"""
         self.close()
 
-    def _get_file_lock(self):
-        """Get the appropriate segmented lock based on current file position"""
-        segment = self._current_size % self._SEGMENTED_LOCK_COUNT
-        return self._file_locks[segment]
-
     def _rotate_log(self):
-        """Thread-safe log rotation with timeout protection"""
+        """Swap the active log file out for rotation. The caller must hold
+        ``_file_lock``.
+
+        Only the cheap part happens here: close the handle, rename the full
+        file to a uniquely numbered staging name and reopen a fresh file.
+        The backup shuffling (one rename per retained backup) runs on the
+        rotation worker thread, so producers blocked on the file lock never
+        wait out a chain of renames.
+        """
         if not self.fp or not self.enable_rotation:
             self._safe_console_output("Rotation disabled")
             return
 
-        # Acquire ALL segmented locks before any conditional return so that
-        # every exit path (early return or exception) releases every lock.
-        for lock in self._file_locks:
-            lock.acquire()
         try:
-            # Check file size
-            actual_size = os.path.getsize(self.fp) if os.path.exists(self.fp) else 0
-            self._safe_console_output(f"Rotation check - Current size: {actual_size}, Max size: {self.max_file_size}")
+            # This instance is the exclusive writer, so the in-memory byte
+            # counter is authoritative - no stat syscall needed per check.
+            if self._trace:
+                self._safe_console_output(f"Rotation check - Current size: {self._current_size}, Max size: {self.max_file_size}")
 
-            if actual_size <= self.max_file_size:
-                self._safe_console_output("Rotation not needed - file size below threshold")
-                return  # finally block releases all locks
+            if self._current_size <= self.max_file_size:
+                return
 
-            # Close current file handle if open
-            if self._file_handle:
+            # Close current fd if open; a rotation is a durability barrier
+            # for force_sync, so settle any group-commit debt first.
+            if self._fd is not None:
                 try:
-                    self._safe_console_output("Closing current file handle for rotation")
-                    self._file_handle.close()
+                    if self.force_sync and self._unsynced_parts:
+                        _fdatasync(self._fd)
+                        self._unsynced_parts = 0
+                    os.close(self._fd)
                 except Exception as e:
-                    self._safe_console_output(f"Error closing file handle: {e}")
+                    self._safe_console_output(f"Error closing file: {e}")
                 finally:
-                    self._file_handle = None
-
-            # Perform rotation with timeout
-            start_time = time.time()
-            timeout = 2.0  # 2 second timeout
-            rotation_success = False
-            self._safe_console_output(f"Starting rotation process for {self.fp}")
+                    self._fd = None
 
+            # The sequence number keeps staging names unique when several
+            # rotations are queued up faster than the worker retires them.
+            staging = f"{self.fp}.rotating.{self._rotation_seq}"
+            self._rotation_seq += 1
             try:
-                # Rotate backups from oldest to newest
-                self._safe_console_output(f"Starting rotation with backup_count={self.backup_count}")
-
-                # First remove the oldest backup if it exists
-                oldest_backup = f"{self.fp}.{self.backup_count}"
-                if os.path.exists(oldest_backup):
-                    try:
-                        self._safe_console_output(f"Removing oldest backup: {oldest_backup}")
-                        os.remove(oldest_backup)
-                    except Exception as e:
-                        self._safe_console_output(f"Error removing oldest backup: {e}")
-
-                # Then rotate the remaining backups
-                for i in range(self.backup_count - 1, 0, -1):
-                    if time.time() - start_time > timeout:
-                        raise TimeoutError("Rotation timeout")
-
-                    src = f"{self.fp}.{i}" if i > 0 else self.fp
-                    dst = f"{self.fp}.{i+1}"
-                    self._safe_console_output(f"Processing rotation: {src} -> {dst}")
-
-                    if os.path.exists(src):
-                        try:
-                            self._safe_console_output(f"Rotating {src} to {dst}")
-                            os.rename(src, dst)
-                        except Exception as e:
-                            self._safe_console_output(f"Error rotating {src} to {dst}: {e}")
-                            continue
-
-                rotation_success = True
-                backup_files = []
-                for i in range(1, self.backup_count + 1):
-                    backup_path = f"{self.fp}.{i}"
-                    if os.path.exists(backup_path):
-                        backup_files.append(backup_path)
-                    else:
-                        try:
-                            with open(backup_path, 'w') as f:
-                                pass
-                            backup_files.append(backup_path)
-                        except Exception as e:
-                            self._safe_console_output(f"Error creating backup file {backup_path}: {e}")
-
-                if len(backup_files) < self.backup_count:
-                    self._safe_console_output(f"Warning: Only created {len(backup_files)} backups, expected {self.backup_count}")
-                else:
-                    self._safe_console_output(f"Log rotation completed - created {len(backup_files)} backups: {backup_files}")
-
-            except TimeoutError:
-                self._safe_console_output("Rotation timed out - attempting recovery")
-                if os.path.exists(self.fp):
-                    try:
-                        self._safe_console_output("Attempting to reopen original file after timeout")
-                        self._open_file()
-                        self._safe_console_output("Successfully recovered original log file")
-                    except Exception as e:
-                        self._safe_console_output(f"Failed to recover log file: {e}")
-                return  # finally block releases all locks
-
-            # Reopen new log file if rotation succeeded
-            if rotation_success:
-                try:
-                    self._safe_console_output("Opening new log file after successful rotation")
-                    self._open_file()
-                    self._current_size = 0
-                    self._safe_console_output(f"New log file opened successfully at {self.fp}")
-                except Exception as e:
-                    self._safe_console_output(f"Error opening new log file: {e}")
+                os.rename(self.fp, staging)
+            except FileNotFoundError:
+                self._open_file()
+                return
+
+            self._open_file()
+            self._current_size = 0
+            self._rotation_queue.append(staging)
+            self._rotation_wake.set()
+            if self._trace:
+                self._safe_console_output(f"Staged {staging} for rotation")
 
         except Exception as e:
             self._safe_console_output(f"Unexpected error during rotation: {e}")
             # Attempt to reopen file if possible
-            if os.path.exists(self.fp):
+            if self._fd is None:
                 try:
                     self._open_file()
                 except Exception:
                     self._safe_console_output("Failed to reopen log file after error")
-        finally:
-            for lock in self._file_locks:
-                lock.release()
+
+    def _rotation_worker(self):
+        """Background thread that retires staged rotation files"""
+        while not self._closed:
+            self._rotation_wake.wait()
+            self._rotation_wake.clear()
+            self._drain_rotations()
+        self._drain_rotations()
+
+    def _drain_rotations(self):
+        """Shift the backup chain and slot staged files in as ``.1``.
+
+        Runs on the rotation worker (and once more from close() to catch
+        files staged by the final flush). Staging names carry a strictly
+        increasing sequence number and the deque preserves order, so
+        backups always age correctly.
+        """
+        while True:
+            try:
+                staging = self._rotation_queue.popleft()
+            except IndexError:
+                return
+            try:
+                self._shift_backups()
+                os.rename(staging, f"{self.fp}.1")
+                if self._trace:
+                    self._safe_console_output(f"Rotated {staging} to {self.fp}.1")
+            except Exception as e:
+                self._safe_console_output(f"Error rotating {staging}: {e}")
+
+    def _shift_backups(self):
+        """Age every backup by one: ``.1`` becomes ``.2`` and so on, with the
+        oldest dropped once ``backup_count`` is exceeded.
+
+        os.replace overwrites the destination atomically on every platform,
+        so renaming ``.{N-1}`` over ``.{N}`` discards the oldest backup for
+        free - no separate remove pass.
+        """
+        for i in range(self.backup_count - 1, 0, -1):
+            src = f"{self.fp}.{i}"
+            dst = f"{self.fp}.{i+1}"
+            try:
+                os.replace(src, dst)
+            except FileNotFoundError:
+                pass  # That backup slot was never filled
+            except Exception as e:
+                self._safe_console_output(f"Error rotating {src} to {dst}: {e}")
+
+    def _wait_for_queue_space(self):
+        """Park the calling producer until the writer has drained the queue
+        below the pending cap.
+
+        Waking the writer and sleeping a short fixed interval keeps the wait
+        cheap (no condition variable on the hot path) while guaranteeing no
+        message is ever dropped. Shutdown aborts the wait so close() can
+        drain whatever made it in.
+        """
+        dq = self._write_queue
+        while len(dq) >= self._MAX_PENDING_MESSAGES and not self._closed:
+            self._wake.set()
+            time.sleep(1e-4)
+
+    def _collect_staged(self):
+        """Move staged messages of every producer thread into the queue.
+
+        Runs once per writer iteration, so a thread that stages a few
+        messages and then goes quiet still sees them written within one
+        flush interval instead of waiting for the handoff thresholds.
+        Buffers of exited threads are dropped from the registry entirely.
+
+        Live buffers are stolen by prefix: the owning thread appends
+        without the lock, but each slice/del here is a single atomic
+        operation under the GIL and appends only ever land past index
+        ``n``, so a message racing the steal just survives into the next
+        sweep. The producer-side handoff takes ``_local_batches_lock``,
+        which keeps the two clear-the-buffer paths from interleaving.
+        """
+        if not self._local_batches:
+            return
+        with self._local_batches_lock:
+            dead = [t for t in self._local_batches if not t.is_alive()]
+            for t in dead:
+                local = self._local_batches.pop(t)
+                if local:
+                    self._write_queue.extend(local)
+            for local in self._local_batches.values():
+                n = len(local)
+                if n:
+                    self._write_queue.extend(local[:n])
+                    del local[:n]
+
+    def _drain_local_batches(self):
+        """Hand every per-thread staging buffer to the write queue.
+
+        Only safe once producers have stopped logging; used by close().
+        """
+        with self._local_batches_lock:
+            batches = list(self._local_batches.values())
+            self._local_batches.clear()
+        for local in batches:
+            if local:
+                self._write_queue.extend(local)
+                del local[:]
 
     def _batch_writer(self):
         """Background thread that writes batches of messages"""
         while not self._closed:
             try:
-                # Get all available messages from queue
-                batch = []
-                batch_size = 0
-                while True:
-                    try:
-                        msg_bytes = self._write_queue.get_nowait()
-                        
-                        # Dynamic batch sizing - smaller batches for large messages
-                        if len(msg_bytes) > self._LARGE_MESSAGE_THRESHOLD:
-                            max_batch_size = max(1, self._BATCH_SIZE // 2)
-                        else:
-                            max_batch_size = self._BATCH_SIZE
-                            
-                        batch.append(msg_bytes)
-                        batch_size += len(msg_bytes)
-                        
-                        if len(batch) >= max_batch_size or batch_size > self._LARGE_MESSAGE_THRESHOLD * 2:
-                            break
-                    except queue.Empty:
-                        break
+                # Pick up staged messages, including from live threads that
+                # have not hit a handoff threshold
+                self._collect_staged()
+
+                # Drain up to a batch in one comprehension over the bound
+                # popleft. len(deque) is O(1) and only producers add to it,
+                # so min() claims a count that is guaranteed to be there -
+                # no exception path and no per-message bookkeeping. Batch
+                # bytes stay bounded by _BATCH_SIZE * _MAX_MESSAGE_SIZE.
+                dq = self._write_queue
+                pop = dq.popleft
+                n = len(dq)
+                if n > self._BATCH_SIZE:
+                    n = self._BATCH_SIZE
+                batch = [pop() for _ in range(n)]
 
                 if batch:
                     self._flush_batch(batch)
-                
-                # Small sleep to prevent busy waiting
-                time.sleep(self._FLUSH_INTERVAL)
+
+                # While a full batch is already waiting, go straight back to
+                # draining - blocking here would throttle a backlog to one
+                # batch per flush interval. Only sleep once the queue is
+                # near-empty, until the interval elapses or a producer
+                # signals that a batch worth of messages has arrived.
+                if len(dq) >= self._BATCH_SIZE:
+                    continue
+                self._wake.wait(timeout=self._FLUSH_INTERVAL)
+                self._wake.clear()
 
             except Exception as e:
                 self._safe_console_output(f"Error in batch writer: {e}")
@@ -352,98 +420,261 @@ class UltraLog:
         if not self.fp or not batch:
             return
 
-        batch_size = sum(len(msg) for msg in batch)
+        batch_size = sum(map(len, batch))
         
         try:
-            # Check if rotation is needed (quick check with lock)
-            needs_rotation = False
+            # Rotation checks and the writes happen in the same critical
+            # section, so the size check, the handle swap and the write can
+            # never interleave with another batch. Batches larger than the
+            # rotation limit (e.g. a close-time drain of staged buffers) are
+            # written in parts so rotation still fires at each boundary.
             with self._file_lock:
-                total_size = self._current_size + batch_size
-                self._safe_console_output(f"Batch write - Current: {self._current_size}, Batch: {batch_size}, Total: {total_size}, Max: {self.max_file_size}")
-                needs_rotation = self.enable_rotation and total_size > self.max_file_size
-            
-            # Perform rotation if needed (without holding write lock)
-            if needs_rotation:
-                self._safe_console_output(f"Triggering rotation - Total size {total_size} exceeds max {self.max_file_size}")
-                self._rotate_log()
-                with self._file_lock:
-                    self._current_size = 0
-
-            # Write batch with minimal lock time using segmented lock
-            lock = self._get_file_lock()
-            with lock:
-                with open(self.fp, 'ab', buffering=self._FILE_BUFFER_SIZE) as f:
-                    for msg_bytes in batch:
-                        bytes_written = f.write(msg_bytes)
-                        self._current_size += bytes_written
-                        self._safe_console_output(f"Wrote {bytes_written} bytes (total: {self._current_size})")
-                    
-                    if self.force_sync:
-                        f.flush()
-                        self._safe_console_output("Forced sync to disk")
+                if self._trace:
+                    self._safe_console_output(f"Batch write - Current: {self._current_size}, Batch: {batch_size}, Max: {self.max_file_size}")
+
+                start = 0
+                n = len(batch)
+                while start < n:
+                    if self.enable_rotation:
+                        # Take messages until the next rotation boundary
+                        part_size = 0
+                        end = start
+                        while end < n:
+                            m = len(batch[end])
+                            if end > start and self._current_size + part_size + m > self.max_file_size:
+                                break
+                            part_size += m
+                            end += 1
+                        if self._current_size + part_size > self.max_file_size:
+                            if self._trace:
+                                self._safe_console_output(f"Triggering rotation - Total size {self._current_size + part_size} exceeds max {self.max_file_size}")
+                            self._rotate_log()
+                    else:
+                        part_size = batch_size
+                        end = n
+
+                    self._write_part(batch[start:end] if (start, end) != (0, n) else batch, part_size)
+                    start = end
                         
         except Exception as e:
             self._safe_console_output(f"Error writing batch to log: {e}")
 
-    @monitor_memory
+    @staticmethod
+    def _write_all(fd, data):
+        """os.write with retry; regular-file appends rarely short-write, but
+        a signal can interrupt one mid-way."""
+        written = os.write(fd, data)
+        while written < len(data):
+            written += os.write(fd, data[written:])
+
+    def _write_part(self, part, part_size):
+        """Write one run of messages. The caller must hold ``_file_lock``."""
+        # Reuse the persistent fd opened by _open_file instead of paying an
+        # open/close syscall pair per batch. O_APPEND puts the write at the
+        # end of the file.
+        if self._fd is None:
+            self._open_file()
+        if self._fd is None:
+            return
+
+        # One syscall per part: single messages are written as-is,
+        # multi-message runs go out as a scatter-gather writev on POSIX so
+        # the kernel gathers the iovec without us paying the O(total_bytes)
+        # copy of a join. Windows falls back to the joined single write.
+        fd = self._fd
+        if len(part) == 1:
+            self._write_all(fd, part[0])
+        elif _HAS_WRITEV:
+            written = os.writev(fd, part)
+            if written < part_size:
+                self._write_all(fd, b"".join(part)[written:])
+        else:
+            buf = self._join_buf
+            del buf[:]
+            for m in part:
+                buf += m
+            self._write_all(fd, buf)
+            # Let one outlier batch not pin a huge allocation forever
+            if len(buf) > self._FILE_BUFFER_SIZE:
+                self._join_buf = bytearray()
+        self._current_size += part_size
+        if self._trace:
+            self._safe_console_output(f"Wrote {part_size} bytes (total: {self._current_size})")
+
+        if self.force_sync:
+            # Group commit: a durable sync per part throttles throughput to
+            # the disk's flush latency, so amortize it - sync after
+            # _SYNC_BATCH_LIMIT parts or once _SYNC_INTERVAL_NS has passed
+            # since the last one. The window of loss on power failure is
+            # bounded by those two knobs.
+            self._unsynced_parts += 1
+            now_ns = time.monotonic_ns()
+            if (self._unsynced_parts >= self._SYNC_BATCH_LIMIT
+                    or now_ns - self._last_sync_ns >= self._SYNC_INTERVAL_NS):
+                _fdatasync(fd)
+                self._unsynced_parts = 0
+                self._last_sync_ns = now_ns
+                if self._trace:
+                    self._safe_console_output("Forced sync to disk")
+
     def log(self, msg: str, level: str = 'INFO') -> None:
         """Asynchronous logging with level checking"""
         if self._closed:
             return
-            
-        level_value = self._LOG_LEVELS.get(level.upper(), 20)
-        if level_value < self.level:
+
+        # Levels arrive uppercase in practice, so try the exact key first
+        # and only pay the .upper() (a string allocation) on a miss.
+        value = self._LOG_LEVELS.get(level)
+        if value is None:
+            value = self._LOG_LEVELS.get(level.upper(), 20)
+        if value < self._level:
+            return
+
+        self._log_enabled(msg, level)
+
+    def _truncate_message(self, msg_bytes: bytes) -> bytes:
+        """Truncate an oversized message on a valid UTF-8 boundary"""
+        truncated = msg_bytes[:self._MAX_MESSAGE_SIZE]
+        # Ensure we don't cut in middle of UTF-8 sequence
+        while truncated and (truncated[-1] & 0b11000000) == 0b10000000:
+            truncated = truncated[:-1]
+        self._safe_console_output(
+            f"Message truncated from {len(msg_bytes)} to {len(truncated)} bytes "
+            f"(max: {self._MAX_MESSAGE_SIZE})"
+        )
+        return truncated
+
+    def _log_enabled(self, msg: str, level: str) -> None:
+        """Format and enqueue a message that already passed the level check"""
+        # Console-only loggers never need the bytes form: format straight to
+        # text instead of encoding and decoding right back.
+        if not self.fp:
+            if self.console_output:
+                self._safe_console_output(
+                    self.formatter.format_message_str(msg, level))
             return
 
         # Format message (already returns bytes)
         msg_bytes = self.formatter.format_message(msg, level)
-        
+
         # Truncate message if exceeds max size with proper UTF-8 boundary
         if len(msg_bytes) > self._MAX_MESSAGE_SIZE:
-            truncated = msg_bytes[:self._MAX_MESSAGE_SIZE]
-            # Ensure we don't cut in middle of UTF-8 sequence
-            while truncated and (truncated[-1] & 0b11000000) == 0b10000000:
-                truncated = truncated[:-1]
-            msg_bytes = truncated
-            self._safe_console_output(
-                f"Message truncated from {len(msg_bytes)} to {len(truncated)} bytes "
-                f"(max: {self._MAX_MESSAGE_SIZE})"
-            )
-
-        msg_str = msg_bytes.decode('utf-8').rstrip()
+            msg_bytes = self._truncate_message(msg_bytes)
 
-        # Console output
+        # Console output - only pay the decode when it is actually shown
         if self.console_output:
-            self._safe_console_output(msg_str)
+            self._safe_console_output(msg_bytes.decode('utf-8', 'replace').rstrip())
 
         # Queue message for file output
-        if self.fp:
-            msg_size = len(msg_bytes)
-            self._safe_console_output(f"Queuing message - Size: {msg_size} bytes")
-            
-            # Adjust batch size dynamically based on message size
-            if msg_size > self._LARGE_MESSAGE_THRESHOLD:
-                batch_size = max(1, self._BATCH_SIZE // 2)  # Smaller batch for large messages
-                self._safe_console_output(f"Using reduced batch size {batch_size} for large message")
-            else:
-                batch_size = self._BATCH_SIZE
-                
-            # Split large messages into chunks
-            if msg_size > self._LARGE_MESSAGE_THRESHOLD:
-                chunk_size = self._LARGE_MESSAGE_THRESHOLD // 2
-                for i in range(0, msg_size, chunk_size):
-                    chunk = msg_bytes[i:i+chunk_size]
-                    self._write_queue.put(chunk)
-            else:
-                self._write_queue.put(msg_bytes)
-
-
-    # Convenience methods
-    def debug(self, msg: str) -> None: self.log(msg, 'DEBUG')
-    def info(self, msg: str) -> None: self.log(msg, 'INFO')
-    def warning(self, msg: str) -> None: self.log(msg, 'WARNING')
-    def error(self, msg: str) -> None: self.log(msg, 'ERROR')
-    def critical(self, msg: str) -> None: self.log(msg, 'CRITICAL')
+        if self._trace:
+            self._safe_console_output(f"Queuing message - Size: {len(msg_bytes)} bytes")
+
+        # Stage in this thread's private buffer; hand the whole buffer
+        # over in one extend once it fills.
+        local = getattr(self._tls, 'batch', None)
+        if local is None:
+            local = []
+            # Key by the Thread object, not the ident: idents are
+            # reused once a thread exits, which would let a new
+            # thread overwrite a buffer awaiting collection.
+            with self._local_batches_lock:
+                self._local_batches[threading.current_thread()] = local
+            self._tls.batch = local
+            self._tls.batch_bytes = 0
+        local.append(msg_bytes)
+        staged_bytes = self._tls.batch_bytes + len(msg_bytes)
+        self._tls.batch_bytes = staged_bytes
+        if (len(local) < self._LOCAL_BATCH_SIZE
+                and staged_bytes < self._LOCAL_BATCH_MAX_BYTES):
+            return
+        if len(self._write_queue) >= self._MAX_PENDING_MESSAGES:
+            self._wait_for_queue_space()
+        # Under the lock so the full clear cannot interleave with the
+        # writer stealing this buffer (see _collect_staged)
+        with self._local_batches_lock:
+            if local:
+                self._write_queue.extend(local)
+                del local[:]
+        self._tls.batch_bytes = 0
+
+        # Wake the writer early when a batch worth of bytes just went
+        # over, or once half a batch of messages has accumulated.
+        if (staged_bytes >= self._LOCAL_BATCH_MAX_BYTES
+                or len(self._write_queue) >= self._BATCH_SIZE // 2):
+            self._wake.set()
+
+
+    def log_many(self, messages) -> None:
+        """Log an iterable of ``(msg, level)`` pairs in one bulk operation.
+
+        Per-message logging pays the producer handoff once per call; callers
+        that already hold a batch of messages can use this to filter and
+        format them all, then hand the whole list to the write queue with a
+        single deque.extend (one atomic operation under the GIL).
+        """
+        if self._closed:
+            return
+
+        levels = self._LOG_LEVELS
+        threshold = self._level
+        format_message = self.formatter.format_message
+        max_size = self._MAX_MESSAGE_SIZE
+
+        encoded = []
+        for msg, level in messages:
+            value = levels.get(level)
+            if value is None:
+                value = levels.get(level.upper(), 20)
+            if value < threshold:
+                continue
+            msg_bytes = format_message(msg, level)
+            if len(msg_bytes) > max_size:
+                msg_bytes = self._truncate_message(msg_bytes)
+            if self.console_output:
+                self._safe_console_output(msg_bytes.decode('utf-8', 'replace').rstrip())
+            encoded.append(msg_bytes)
+
+        if self.fp and encoded:
+            if len(self._write_queue) >= self._MAX_PENDING_MESSAGES:
+                self._wait_for_queue_space()
+            self._write_queue.extend(encoded)
+            if len(self._write_queue) >= self._BATCH_SIZE // 2:
+                self._wake.set()
+
+    # Convenience methods. Each level's numeric value is a known constant, so
+    # these compare it against the threshold directly and drop disabled
+    # messages before any formatting - no .upper(), no dict lookup.
+    def debug(self, msg: str) -> None:
+        if not self._closed and self._level <= 10:
+            self._log_enabled(msg, 'DEBUG')
+
+    def info(self, msg: str) -> None:
+        if not self._closed and self._level <= 20:
+            self._log_enabled(msg, 'INFO')
+
+    def warning(self, msg: str) -> None:
+        if not self._closed and self._level <= 30:
+            self._log_enabled(msg, 'WARNING')
+
+    def error(self, msg: str) -> None:
+        if not self._closed and self._level <= 40:
+            self._log_enabled(msg, 'ERROR')
+
+    def critical(self, msg: str) -> None:
+        if not self._closed and self._level <= 50:
+            self._log_enabled(msg, 'CRITICAL')
+
+    def sync_now(self) -> None:
+        """Durability barrier: push everything already written to disk now.
+
+        Useful for callers running with the group-commit force_sync policy
+        who need a known-durable point (e.g. before reporting success).
+        """
+        with self._file_lock:
+            if self._fd is not None:
+                _fdatasync(self._fd)
+                self._unsynced_parts = 0
+                self._last_sync_ns = time.monotonic_ns()
 
     def close(self):
         """Close the logger and release resources"""
@@ -451,54 +682,55 @@ class UltraLog:
             return
             
         self._closed = True
+        self._wake.set()  # Let the writer thread notice shutdown promptly
         self._safe_console_output("Starting logger shutdown")
-        
-        # Process all remaining messages in queue with timeout
-        start_time = time.time()
-        timeout = 5.0  # 5 second timeout for shutdown
-        
-        while not self._write_queue.empty() and time.time() - start_time < timeout:
-            batch = []
-            while not self._write_queue.empty() and len(batch) < self._BATCH_SIZE:
-                try:
-                    msg_bytes = self._write_queue.get_nowait()
-                    batch.append(msg_bytes)
-                except queue.Empty:
-                    break
-            
-            if batch:
-                self._safe_console_output(f"Flushing final batch of {len(batch)} messages")
-                try:
-                    self._flush_batch(batch)
-                except Exception as e:
-                    self._safe_console_output(f"Error flushing final batch: {e}")
-        
-        # Wait for writer thread to finish with timeout
+
+        # Stop the writer thread first so the final drain below cannot race
+        # it (a concurrent popleft during the snapshot could write messages
+        # twice).
         if hasattr(self, '_writer_thread') and self._writer_thread.is_alive():
             self._safe_console_output("Waiting for writer thread to finish")
-            self._writer_thread.join(timeout=1.0)
+            self._writer_thread.join(timeout=5.0)
             if self._writer_thread.is_alive():
                 self._safe_console_output("Writer thread did not exit in time")
+
+        # Collect whatever is still sitting in per-thread staging buffers
+        self._drain_local_batches()
+
+        # Snapshot the whole backlog in one swap instead of popping entries
+        # one by one, then flush it in writer-sized chunks.
+        pending = list(self._write_queue)
+        self._write_queue.clear()
+        if pending:
+            self._safe_console_output(f"Flushing {len(pending)} remaining messages")
+        for start in range(0, len(pending), self._BATCH_SIZE):
+            try:
+                self._flush_batch(pending[start:start + self._BATCH_SIZE])
+            except Exception as e:
+                self._safe_console_output(f"Error flushing final batch: {e}")
         
-        # Close file handles with all locks protection
-        for lock in self._file_locks:
-            lock.acquire()
-            
-        try:
-            if self._file_handle:
+        # Close the fd under the file lock
+        with self._file_lock:
+            if self._fd is not None:
                 try:
                     self._safe_console_output("Closing file handle")
-                    self._file_handle.flush()
-                    self._file_handle.close()
+                    if self.force_sync and self._unsynced_parts:
+                        _fdatasync(self._fd)
+                        self._unsynced_parts = 0
+                    os.close(self._fd)
                 except Exception as e:
                     self._safe_console_output(f"Error closing file handle: {e}")
                 finally:
-                    self._file_handle = None
-                    self._file = None
-        
-        finally:
-            for lock in self._file_locks:
-                lock.release()
-                
+                    self._fd = None
+
+        # Retire any rotation files staged by the final flush: wake the
+        # worker, wait for it to exit, then drain directly in case it had
+        # already stopped before the last batch rotated.
+        if self._rotation_thread is not None:
+            self._rotation_wake.set()
+            if self._rotation_thread.is_alive():
+                self._rotation_thread.join(timeout=5.0)
+            self._drain_rotations()
+
         self._safe_console_output("Logger shutdown complete")
 
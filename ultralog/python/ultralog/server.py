@@ -104,6 +104,35 @@ async def log_message(request: Request, _: None = Depends(verify_token)):
             detail=str(e)
         )
 
+@app.post("/log_batch")
+async def log_message_batch(request: Request, _: None = Depends(verify_token)):
+    """Accept a bundle of log records in one request.
+
+    Clients batch records client-side and ship them here, paying the HTTP
+    round-trip once per bundle instead of once per record. Single-record
+    ``/log`` stays available for compatibility.
+    """
+    try:
+        data = await request.json()
+        entries = data.get("batch", [])
+        logger = app.state.logger
+
+        for entry in entries:
+            level = entry.get("level", "INFO").upper()
+            message = entry.get("message", "")
+
+            if level in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"):
+                logger.log(message, level)
+            else:
+                logger.log(message)
+
+        return {"status": "success", "count": len(entries)}
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
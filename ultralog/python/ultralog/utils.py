@@ -1,5 +1,5 @@
-from datetime import datetime
 import os
+import sys
 import threading
 import time
 from typing import Any, TypeVar, Callable, Optional, Union, Type
@@ -64,46 +64,106 @@ def get_env_variable(
         return default
     
 
+# Per-thread scratch buffer reused across format_message calls, so steady
+# logging does not allocate a fresh build buffer per message.
+_scratch_tls = threading.local()
+
+
 class LogFormatter:
     _TIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+    # strftime has no %f, so refreshes format the seconds part with this and
+    # append the microseconds from the float timestamp themselves.
+    _TIME_FORMAT_SECONDS = "%Y-%m-%d %H:%M:%S"
+    _SCRATCH_SHRINK_LIMIT = 128 * 1024  # Replace the buffer after an outlier message
     _TIMESTAMP_CACHE_TIME = 0.5
     DEFAULT_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(module)s:<module>:%(line)s - %(message)s"
 
+    _LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+
     def __init__(self, name: str = "Logger", with_time: bool = True, fmt: Optional[str] = None):
         self._name = name
         self.with_time = with_time
         self.fmt = fmt or self.DEFAULT_FORMAT
-        self._last_timestamp = ""
-        self._last_timestamp_time = 0
-        self._timestamp_lock = threading.Lock()
-        
+        # (refresh time, formatted str, formatted bytes). Replacing the whole
+        # tuple is atomic under the GIL, so readers never see a torn update
+        # and no lock is needed: if two threads race past an expired cache
+        # they just format the same instant twice.
+        self._ts_cache = (0.0, "", b"")
+        self._compile_fast_path()
+        # with_time is fixed for the lifetime of the formatter, so the
+        # specialization is picked once here instead of re-testing the flag
+        # on every message.
+        self.format_message = (
+            self._format_with_time if with_time else self._format_no_time
+        )
+
+    def _compile_fast_path(self) -> None:
+        """Precompute the constant per-level fragments of the default format.
+
+        The default format is by far the common case; baking its constant
+        substrings into ready-made bytes turns format_message into a single
+        b"".join of prebuilt pieces instead of a dict build, %-interpolation
+        and full UTF-8 encode per call. Custom formats keep the generic path.
+        """
+        if self.fmt == self.DEFAULT_FORMAT:
+            self._level_prefix_bytes = {
+                level: f" | {level:<8} | {self._name} | ".encode('utf-8')
+                for level in self._LEVELS
+            }
+            # str twins of the same prefixes, for sinks that want text
+            # (console echo) without an encode/decode round trip.
+            self._level_prefix_str = {
+                level: f" | {level:<8} | {self._name} | "
+                for level in self._LEVELS
+            }
+        else:
+            self._level_prefix_bytes = None
+            self._level_prefix_str = None
+
+    def _refresh_timestamp(self, current_time: float) -> tuple:
+        """Format the current time and atomically publish the new cache"""
+        # time.strftime over a struct_time skips the datetime object (and
+        # its timezone machinery) that datetime.now().strftime built per
+        # refresh; the sub-second digits come straight from the float.
+        formatted = "%s.%06d" % (
+            time.strftime(self._TIME_FORMAT_SECONDS, time.localtime(current_time)),
+            int((current_time % 1.0) * 1e6),
+        )
+        cache = (current_time, formatted, formatted.encode('ascii'))
+        self._ts_cache = cache
+        return cache
+
     def _get_timestamp(self) -> str:
-        """Get cached timestamp (thread-safe)"""
+        """Get cached timestamp (lock-free)"""
         current_time = time.time()
-        if current_time - self._last_timestamp_time > self._TIMESTAMP_CACHE_TIME:
-            with self._timestamp_lock:
-                if current_time - self._last_timestamp_time > self._TIMESTAMP_CACHE_TIME:
-                    self._last_timestamp = datetime.now().strftime(self._TIME_FORMAT)
-                    self._last_timestamp_time = current_time
-        return self._last_timestamp
-
-    def format_message(self, msg: str, level: str) -> bytes:
-        """Format log message as bytes using the format string"""
-        import sys
-        import os
-        
+        cache = self._ts_cache
+        if current_time - cache[0] > self._TIMESTAMP_CACHE_TIME:
+            cache = self._refresh_timestamp(current_time)
+        return cache[1]
+
+    def _get_timestamp_bytes(self) -> bytes:
+        """Get the cached timestamp already encoded as bytes (lock-free)"""
+        current_time = time.time()
+        cache = self._ts_cache
+        if current_time - cache[0] > self._TIMESTAMP_CACHE_TIME:
+            cache = self._refresh_timestamp(current_time)
+        return cache[2]
+
+    @staticmethod
+    def _caller_info() -> str:
+        """Locate the first stack frame outside ultralog itself"""
         # Initialize default values
         line_no = 1
         filename = "__main__"
         caller_info = f"{filename}:<module>:{line_no}"
-        
+
         try:
             # Get the current frame (much faster than getouterframes)
             frame = sys._getframe(1)  # Skip this frame
-            
+
             # Skip frames from ultralog itself
             while frame:
-                if (not frame.f_globals.get('__name__', '').startswith('ultralog') and 
+                if (not frame.f_globals.get('__name__', '').startswith('ultralog') and
                    not frame.f_code.co_filename.endswith('ultralog/__init__.py')):
                     # Found first non-ultralog frame
                     line_no = frame.f_lineno
@@ -115,10 +175,82 @@ class LogFormatter:
                     caller_info = f"{filename}:<module>:{line_no}"
                     break
                 frame = frame.f_back
-                
+
         except Exception:
             pass  # Keep default values if anything goes wrong
 
+        return caller_info
+
+    # format_message is bound in __init__ to one of the two specializations
+    # below. Both share the fast path built by _compile_fast_path: a known
+    # level under the default format is assembled in a reused per-thread
+    # scratch buffer - no record dict, no %-interpolation, and only the
+    # final exact-size bytes is allocated. Custom formats fall back to
+    # generic %-interpolation over a record dict.
+
+    def _format_with_time(self, msg: str, level: str) -> bytes:
+        """Format log message as bytes, timestamp first"""
+        caller_info = self._caller_info()
+
+        prefix_bytes = self._level_prefix_bytes
+        prefix = prefix_bytes.get(level) if prefix_bytes is not None else None
+        if prefix is not None:
+            buf = getattr(_scratch_tls, 'buf', None)
+            if buf is None or len(buf) > self._SCRATCH_SHRINK_LIMIT:
+                buf = _scratch_tls.buf = bytearray()
+            else:
+                del buf[:]
+            buf += self._get_timestamp_bytes()
+            buf += prefix
+            buf += caller_info.encode('utf-8')
+            buf += b" - "
+            buf += msg.encode('utf-8')
+            buf += b"\n"
+            return bytes(buf)
+
+        return self._format_generic(msg, level, caller_info)
+
+    def _format_no_time(self, msg: str, level: str) -> bytes:
+        """Format log message as bytes without a timestamp"""
+        caller_info = self._caller_info()
+
+        prefix_bytes = self._level_prefix_bytes
+        prefix = prefix_bytes.get(level) if prefix_bytes is not None else None
+        if prefix is not None:
+            buf = getattr(_scratch_tls, 'buf', None)
+            if buf is None or len(buf) > self._SCRATCH_SHRINK_LIMIT:
+                buf = _scratch_tls.buf = bytearray()
+            else:
+                del buf[:]
+            buf += prefix
+            buf += caller_info.encode('utf-8')
+            buf += b" - "
+            buf += msg.encode('utf-8')
+            buf += b"\n"
+            return bytes(buf)
+
+        return self._format_generic(msg, level, caller_info)
+
+    def format_message_str(self, msg: str, level: str) -> str:
+        """Format a log message as text, without the trailing newline.
+
+        For console-only loggers this avoids formatting to bytes and
+        decoding straight back; the pieces are joined as str in one
+        f-string.
+        """
+        caller_info = self._caller_info()
+
+        prefix_str = self._level_prefix_str
+        prefix = prefix_str.get(level) if prefix_str is not None else None
+        if prefix is not None:
+            ts = self._get_timestamp() if self.with_time else ""
+            return f"{ts}{prefix}{caller_info} - {msg}"
+
+        return self._format_generic(msg, level, caller_info).decode(
+            'utf-8', 'replace').rstrip()
+
+    def _format_generic(self, msg: str, level: str, caller_info: str) -> bytes:
+        """%-interpolation fallback for custom formats"""
         # Cache the split parts to avoid repeated string splitting
         module, func, line = caller_info.split(':')
         record = {
@@ -130,13 +262,13 @@ class LogFormatter:
             'line': line,
             'name': self._name
         }
-        
+
         try:
             formatted = self.fmt % record
         except KeyError as e:
             formatted = f"Invalid log format placeholder: {e}. Using default format."
             formatted = self.DEFAULT_FORMAT % record
-            
+
         return f"{formatted}\n".encode('utf-8')
 
     @property
@@ -146,5 +278,5 @@ class LogFormatter:
 
     def set_format(self, fmt: str) -> None:
         """Update the log format string dynamically"""
-        with self._timestamp_lock:  # Use existing lock for thread safety
-            self.fmt = fmt
+        self.fmt = fmt
+        self._compile_fast_path()